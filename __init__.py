@@ -12,16 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+import os
+import pickle
 import pytz
+import re
+import threading
 import time
-from copy import deepcopy
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from datetime import datetime, timedelta
-from multi_key_dict import multi_key_dict
+from functools import lru_cache
+from itertools import groupby, islice
 from pyowm.webapi25.forecaster import Forecaster
 from pyowm.webapi25.forecastparser import ForecastParser
 from pyowm.webapi25.observationparser import ObservationParser
-from requests import HTTPError, Response
+from requests import HTTPError, RequestException, Response
 
 import mycroft.audio
 from adapt.intent import IntentBuilder
@@ -37,6 +43,18 @@ from mycroft.util.time import now_local, to_utc, to_local
 
 MINUTES = 60  # Minutes to seconds multiplier
 
+# Time OWM results are reused within the skill before being fetched again
+CURRENT_CACHE_TTL = 15 * MINUTES
+FORECAST_CACHE_TTL = 60 * MINUTES
+API_CACHE_SIZE = 32  # Maximum number of cached OWM results
+API_CACHE_FILE = 'owm-cache.pkl'  # Keeps the results across restarts
+
+
+@lru_cache(maxsize=16)
+def get_timezone(name):
+    """ Get the pytz timezone for a name, reusing earlier lookups. """
+    return pytz.timezone(name)
+
 
 class LocationNotFoundError(ValueError):
     pass
@@ -45,6 +63,32 @@ class LocationNotFoundError(ValueError):
 APIErrors = (LocationNotFoundError, HTTPError)
 
 
+# Languages supported by OWM
+OWM_LANGUAGES = frozenset((
+    'ar', 'bg', 'ca', 'cz', 'da', 'de', 'el', 'en', 'fa', 'fi', 'fr', 'gl',
+    'hr', 'hu', 'it', 'ja', 'kr', 'la', 'lt', 'mk', 'nl', 'pl', 'pt', 'ro',
+    'ru', 'se', 'sk', 'sl', 'es', 'tr', 'ua', 'vi'
+))
+# Language codes OWM uses differently than Mycroft
+OWM_LANGUAGE_LOOKUP = {
+    'sv': 'se',
+    'cs': 'cz',
+    'ko': 'kr',
+    'lv': 'la',
+    'uk': 'ua'
+}
+
+
+# Maximum number of OWM responses kept by OWMApi
+QUERY_CACHE_SIZE = 256
+# Time OWM responses are reused by path, 15 minutes if not listed
+QUERY_CACHE_TTL = {
+    '/forecast/daily': 60 * MINUTES
+}
+# Oldest response still used when OWM can't be reached
+QUERY_STALE_MAX_AGE = 3 * 60 * MINUTES
+
+
 """
     This skill uses the Open Weather Map API (https://openweathermap.org) and
     the PyOWM wrapper for it.  For more info, see:
@@ -60,6 +104,54 @@ APIErrors = (LocationNotFoundError, HTTPError)
 """
 
 
+# Translate OWM weather-conditions codes into the Mycroft weather icon codes
+# (see https://openweathermap.org/weather-conditions)
+ICON_CODES = {code: icon for codes, icon in (
+    (('01d', '01n'), 0),                # clear
+    (('02d', '02n', '03d', '03n'), 1),  # partly cloudy
+    (('04d', '04n'), 2),                # cloudy
+    (('09d', '09n'), 3),                # light rain
+    (('10d', '10n'), 4),                # raining
+    (('11d', '11n'), 5),                # stormy
+    (('13d', '13n'), 6),                # snowing
+    (('50d', '50n'), 7),                # windy/misty
+) for code in codes}
+
+
+# Abbreviated weekday names by datetime.weekday()
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+# Pages shown on screen for a weather report
+GUI_PAGES = ["weather.qml", "highlow.qml", "forecast1.qml", "forecast2.qml"]
+
+
+# Dialog for a reported condition by (future day, location given)
+REPORT_CONDITION_DIALOGS = {
+    (False, False): "report.condition",
+    (False, True): "report.condition.at.location",
+    (True, False): "report.condition.future",
+    (True, True): "report.condition.future.at.location"
+}
+
+
+# Period of the day by hour
+HOUR_TO_PERIOD = (("overnight",) +           # 0
+                  ("early morning",) * 4 +   # 1 - 4
+                  ("morning",) * 7 +         # 5 - 11
+                  ("afternoon",) * 5 +       # 12 - 16
+                  ("evening",) * 3 +         # 17 - 19
+                  ("overnight",) * 4)        # 20 - 23
+
+# Languages with a spoken nice_time implementation in mycroft-core
+NICE_TIME_LANGUAGES = frozenset(('en', 'es', 'it', 'fr', 'de',
+                                 'hu', 'nl', 'da'))
+
+
+# Compass directions clockwise from north, 45 degrees apart
+WIND_DIRECTIONS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
+
 # Windstrength limits in miles per hour
 WINDSTRENGTH_MPH = {
     'hard': 20,
@@ -74,6 +166,13 @@ WINDSTRENGTH_MPS = {
 }
 
 
+# Converts m/s to miles per hour
+MILES_PER_HOUR_MULTIPLIER = 2.23694
+# Upper wind speed limits in m/s of the spoken wind strengths
+LIGHT_WIND_MAX_MPS = 2.2352
+MEDIUM_WIND_MAX_MPS = 6.7056
+
+
 class OWMApi(Api):
     ''' Wrapper that defaults to the Mycroft cloud proxy so user's don't need
         to get their own OWM API keys '''
@@ -85,9 +184,15 @@ class OWMApi(Api):
         self.observation = ObservationParser()
         self.forecast = ForecastParser()
         self.query_cache = {}
+        # Largest-cnt response per query, keyed without the cnt parameter
+        self.cnt_cache = {}
+        # Guards query_cache and cnt_cache, requests run on several threads
+        self.cache_lock = threading.Lock()
         self.location_translations = {}
+        self.__thread = threading.local()
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_language(lang):
         """
         OWM supports 31 languages, see https://openweathermap.org/current#multi
@@ -105,26 +210,14 @@ class OWMApi(Api):
 
         # special cases cont'd
         lang = lang.lower().split("-")
-        lookup = {
-            'sv': 'se',
-            'cs': 'cz',
-            'ko': 'kr',
-            'lv': 'la',
-            'uk': 'ua'
-        }
-        if lang[0] in lookup:
-            return lookup[lang[0]]
-
-        owmsupported = ['ar', 'bg', 'ca', 'cz', 'da', 'de', 'el', 'en', 'fa', 'fi',
-                        'fr', 'gl', 'hr', 'hu', 'it', 'ja', 'kr', 'la', 'lt',
-                        'mk', 'nl', 'pl', 'pt', 'ro', 'ru', 'se', 'sk', 'sl',
-                        'es', 'tr', 'ua', 'vi']
+        if lang[0] in OWM_LANGUAGE_LOOKUP:
+            return OWM_LANGUAGE_LOOKUP[lang[0]]
 
-        if lang[0] in owmsupported:
+        if lang[0] in OWM_LANGUAGES:
             return lang[0]
 
         if (len(lang) == 2):
-            if lang[1] in owmsupported:
+            if lang[1] in OWM_LANGUAGES:
                 return lang[1]
         return owmlang
 
@@ -132,31 +225,88 @@ class OWMApi(Api):
         params.get("query").update({"lang": self.owmlang})
         return params.get("query")
 
+    @staticmethod
+    def cache_key(data):
+        """ Hashable key identifying a request, regardless of key order. """
+        return data['path'], frozenset(data['query'].items())
+
+    @staticmethod
+    def cnt_cache_key(data):
+        """ Key for a request with its cnt parameter left out. """
+        query = frozenset((k, v) for k, v in data['query'].items()
+                          if k != 'cnt')
+        return data['path'], query
+
+    def __thread_api(self):
+        """ Get this Api's copy for the calling thread.
+
+        Api.request() keeps the request on the instance to resend it after
+        a token refresh, so concurrent requests must not share an instance.
+        The copies share the caches and translations with this instance.
+        """
+        api = getattr(self.__thread, 'api', None)
+        if api is None or api.owmlang != self.owmlang:
+            api = copy(self)
+            self.__thread.api = api
+        return api
+
+    def stale_count(self):
+        """ Number of stale fallback responses served to this thread.
+
+        Callers caching results compare it before and after a call to
+        tell fresh data from a fallback after a failed request.
+        """
+        return getattr(self.__thread, 'stale', 0)
+
     def request(self, data):
         """ Caching the responses """
-        req_hash = hash(json.dumps(data, sort_keys=True))
-        cache = self.query_cache.get(req_hash, (0, None))
-        # check for caches with more days data than requested
-        if data['query'].get('cnt') and cache == (0, None):
-            test_req_data = deepcopy(data)
-            while test_req_data['query']['cnt'] < 16 and cache == (0, None):
-                test_req_data['query']['cnt'] += 1
-                test_hash = hash(json.dumps(test_req_data, sort_keys=True))
-                test_cache = self.query_cache.get(test_hash, (0, None))
-                if test_cache != (0, None):
-                    cache = test_cache
-        # Use cached response if value exists and was fetched within 15 min
+        req_hash = self.cache_key(data)
+        cnt = data['query'].get('cnt')
+        if cnt:
+            cnt_hash = self.cnt_cache_key(data)
+        with self.cache_lock:
+            cache = self.query_cache.get(req_hash, (0, None))
+            # check for a newer cache with more days data than requested
+            if cnt:
+                hit = self.cnt_cache.get(cnt_hash)
+                if hit and hit[0] >= cnt and hit[1] > cache[0]:
+                    cache = hit[1:]
+        # Use cached response if value exists and is younger than its TTL
         now = time.monotonic()
-        if now > (cache[0] + 15 * MINUTES) or cache[1] is None:
-            resp = super().request(data)
+        ttl = QUERY_CACHE_TTL.get(data['path'], 15 * MINUTES)
+        if now > (cache[0] + ttl) or cache[1] is None:
+            try:
+                resp = Api.request(self.__thread_api(), data)
+            except RequestException as e:
+                # A somewhat outdated forecast beats no answer at all
+                age = now - cache[0]
+                if cache[1] is None or age > QUERY_STALE_MAX_AGE:
+                    raise
+                LOG.warning('OWM request failed, using %d minute old '
+                            'response: %s', age // MINUTES, e)
+                self.__thread.stale = self.stale_count() + 1
+                return cache[1]
             # 404 returned as JSON-like string in some instances
             if isinstance(resp, str) and '{"cod":"404"' in resp:
                 r = Response()
                 r.status_code = 404
                 raise HTTPError(resp, response=r)
-            self.query_cache[req_hash] = (now, resp)
+            with self.cache_lock:
+                # Keep the cache bounded, dropping the oldest responses first
+                self.query_cache.pop(req_hash, None)
+                self.query_cache[req_hash] = (now, resp)
+                while len(self.query_cache) > QUERY_CACHE_SIZE:
+                    del self.query_cache[next(iter(self.query_cache))]
+                if cnt:
+                    # Replace a smaller response, or any that has gone stale
+                    hit = self.cnt_cache.get(cnt_hash)
+                    if not hit or hit[0] <= cnt or now > hit[1] + ttl:
+                        self.cnt_cache.pop(cnt_hash, None)
+                        self.cnt_cache[cnt_hash] = (cnt, now, resp)
+                    while len(self.cnt_cache) > QUERY_CACHE_SIZE:
+                        del self.cnt_cache[next(iter(self.cnt_cache))]
         else:
-            LOG.debug('Using cached OWM Response from {}'.format(cache[0]))
+            LOG.debug('Using cached OWM Response from %s', cache[0])
             resp = cache[1]
         return resp
 
@@ -164,21 +314,20 @@ class OWMApi(Api):
         return response.text
 
     def weather_at_location(self, name):
-        if name == '':
-            raise LocationNotFoundError('The location couldn\'t be found')
-
-        q = {"q": name}
-        try:
-            data = self.request({
-                "path": "/weather",
-                "query": q
-            })
-            return self.observation.parse_JSON(data), name
-        except HTTPError as e:
-            if e.response.status_code == 404:
+        while name != '':
+            try:
+                data = self.request({
+                    "path": "/weather",
+                    "query": {"q": name}
+                })
+                return self.observation.parse_JSON(data), name
+            except HTTPError as e:
+                if e.response.status_code != 404:
+                    raise
+                # Remove last word in name
                 name = ' '.join(name.split()[:-1])
-                return self.weather_at_location(name)
-            raise
+
+        raise LocationNotFoundError('The location couldn\'t be found')
 
     def weather_at_place(self, name, lat, lon):
         if lat and lon:
@@ -227,9 +376,10 @@ class OWMApi(Api):
                 self.location_translations[orig_name] = name
                 return forecast
             except HTTPError as e:
-                if e.response.status_code == 404:
-                    # Remove last word in name
-                    name = ' '.join(name.split()[:-1])
+                if e.response.status_code != 404:
+                    raise
+                # Remove last word in name
+                name = ' '.join(name.split()[:-1])
 
         raise LocationNotFoundError('The location couldn\'t be found')
 
@@ -271,18 +421,22 @@ class WeatherSkill(MycroftSkill):
     def __init__(self):
         super().__init__("WeatherSkill")
 
-        # Build a dictionary to translate OWM weather-conditions
-        # codes into the Mycroft weather icon codes
-        # (see https://openweathermap.org/weather-conditions)
-        self.CODES = multi_key_dict()
-        self.CODES['01d', '01n'] = 0                # clear
-        self.CODES['02d', '02n', '03d', '03n'] = 1  # partly cloudy
-        self.CODES['04d', '04n'] = 2                # cloudy
-        self.CODES['09d', '09n'] = 3                # light rain
-        self.CODES['10d', '10n'] = 4                # raining
-        self.CODES['11d', '11n'] = 5                # stormy
-        self.CODES['13d', '13n'] = 6                # snowing
-        self.CODES['50d', '50n'] = 7                # windy/misty
+        # Last result of __get_today() per language, with the second it is
+        # valid for
+        self.__today_cache = {}
+        # Speakable text for today and the (lang, date) it is valid for
+        self.__today_text = (None, None)
+        # Last message and the unit requested in it
+        self.__unit_cache = (None, None)
+        # Dialog renderer and its template names, see __template_names()
+        self.__templates = (None, frozenset())
+        # Compiled vocabularies, see __voc_match()
+        self.__voc_patterns = {}
+        # OWM results by call, see __cached_call()
+        self.__api_cache = {}
+        self.__api_cache_lock = threading.Lock()
+        # Runs independent OWM requests concurrently
+        self.__io_pool = ThreadPoolExecutor(max_workers=4)
 
         # Use Mycroft proxy if no private key provided
         self.settings["api_key"] = None
@@ -302,6 +456,7 @@ class WeatherSkill(MycroftSkill):
         if self.owm:
             self.owm.set_OWM_language(lang=OWMApi.get_language(self.lang))
 
+        self.__load_api_cache()
         self.schedule_for_daily_use()
         try:
             self.mark2_forecast(self.__initialize_report(None))
@@ -311,6 +466,11 @@ class WeatherSkill(MycroftSkill):
 
         # self.test_screen()    # DEBUG:  Used during screen testing/debugging
 
+    def shutdown(self):
+        self.__io_pool.shutdown(wait=False)
+        self.__save_api_cache()
+        super().shutdown()
+
     def test_screen(self):
         self.gui["current"] = 72
         self.gui["min"] = 83
@@ -325,36 +485,30 @@ class WeatherSkill(MycroftSkill):
         self.gui.show_page('weather.qml')
 
     def prime_weather_cache(self):
-        # If not already cached, this will reach out for current conditions
+        # If not already cached, this will reach out for current conditions.
+        # Results that are still fresh are served by __cached_call() without
+        # contacting OWM at all.
         report = self.__initialize_report(None)
         try:
-            self.owm.weather_at_place(
+            self.__cached_weather_at_place(
                 report['full_location'], report['lat'],
                 report['lon']).get_weather()
-            self.owm.daily_forecast(report['full_location'],
-                                    report['lat'], report['lon'], limit=16)
+            self.__cached_daily_forecast(report['full_location'],
+                                         report['lat'], report['lon'],
+                                         limit=16)
         except Exception as e:
             self.log.error('Failed to prime weather cache '
                            '({})'.format(repr(e)))
 
     def schedule_for_daily_use(self):
         # Assume the user has a semi-regular schedule.  Whenever this method
-        # is called, it will establish a 45 minute window of pre-cached
-        # weather info for the next day allowing for snappy responses to the
-        # daily query.
+        # is called, it will pre-cache weather info at the same time the next
+        # day allowing for snappy responses to the daily query.
         self.prime_weather_cache()
         self.cancel_scheduled_event("precache1")
-        self.cancel_scheduled_event("precache2")
-        self.cancel_scheduled_event("precache3")
         self.schedule_repeating_event(self.prime_weather_cache, None,
                                       60*60*24,         # One day in seconds
                                       name="precache1")
-        self.schedule_repeating_event(self.prime_weather_cache, None,
-                                      60*60*24-60*15,   # One day - 15 minutes
-                                      name="precache2")
-        self.schedule_repeating_event(self.prime_weather_cache, None,
-                                      60*60*24+60*15,   # One day + 15 minutes
-                                      name="precache3")
 
     def get_coming_days_forecast(self, forecast, unit, days=None):
         """
@@ -369,16 +523,21 @@ class WeatherSkill(MycroftSkill):
             Returns: List of dicts containg weather info
         """
         days = days or 4
-        weekdays = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
         forecast_list = []
+        weathers = forecast.get_weathers()
+        if not weathers:
+            return forecast_list
+        # One entry per day, so only the first entry's weekday is needed.
+        # Not datetime.now(), the forecast may have been cached since
+        # before midnight.
+        first = datetime.fromtimestamp(weathers[0].get_reference_time())
+        tomorrow = first.weekday() + 1
         # Get tomorrow and 4 days forward
-        for weather in list(forecast.get_weathers())[1:5]:
+        for i, weather in enumerate(islice(weathers, 1, 5)):
             result_temp = weather.get_temperature(unit)
-            day_num = datetime.weekday(
-                datetime.fromtimestamp(weather.get_reference_time()))
-            result_temp_day = weekdays[day_num]
+            result_temp_day = WEEKDAYS[(tomorrow + i) % 7]
             forecast_list.append({
-                "weathercode": self.CODES[weather.get_weather_icon_name()],
+                "weathercode": ICON_CODES[weather.get_weather_icon_name()],
                 "max": round(result_temp['max']),
                 "min": round(result_temp['min']),
                 "date": result_temp_day
@@ -387,9 +546,9 @@ class WeatherSkill(MycroftSkill):
 
     def mark2_forecast(self, report):
         """ Builds forecast for the upcoming days for the Mark-2 display."""
-        future_weather = self.owm.daily_forecast(report['full_location'],
-                                                 report['lat'],
-                                                 report['lon'], limit=5)
+        future_weather = self.__cached_daily_forecast(report['full_location'],
+                                                      report['lat'],
+                                                      report['lon'], limit=5)
         if future_weather is None:
             self.__report_no_data('weather')
             return
@@ -413,11 +572,11 @@ class WeatherSkill(MycroftSkill):
         try:
             self.log.debug("Handler: handle_current_weather")
             # Get a date from requests like "weather for next Tuesday"
-            today, _ = self.__extract_datetime("today")
+            today = self.__get_today()
             when, _ = self.__extract_datetime(message.data.get('utterance'),
                                               lang=self.lang)
             if when and when != today:
-                self.log.debug("Doing a forecast {} {}".format(today, when))
+                self.log.debug("Doing a forecast %s %s", today, when)
                 return self.handle_forecast(message)
 
             report = self.__populate_report(message)
@@ -537,7 +696,7 @@ class WeatherSkill(MycroftSkill):
         # Get a date from spoken request
         when, _ = self.__extract_datetime(message.data.get('utterance'),
                                           lang=self.lang)
-        today, _ = self.__extract_datetime('today', lang='en-us')
+        today = self.__get_today(lang='en-us')
 
         if today == when:
             self.handle_current_weather(message)
@@ -555,10 +714,10 @@ class WeatherSkill(MycroftSkill):
         report = self.__initialize_report(message)
 
         # Get near-future forecast
-        forecastWeather = self.owm.three_hours_forecast(
+        forecastWeather = next(iter(self.__cached_three_hours_forecast(
             report['full_location'],
             report['lat'],
-            report['lon']).get_forecast().get_weathers()[0]
+            report['lon']).get_forecast().get_weathers()), None)
 
         if forecastWeather is None:
             self.__report_no_data('weather')
@@ -566,11 +725,9 @@ class WeatherSkill(MycroftSkill):
 
         # NOTE: The 3-hour forecast uses different temperature labels,
         # temp, temp_min and temp_max.
-        report['temp'] = self.__get_temperature(forecastWeather, 'temp')
-        report['temp_min'] = self.__get_temperature(forecastWeather,
-                                                    'temp_min')
-        report['temp_max'] = self.__get_temperature(forecastWeather,
-                                                    'temp_max')
+        report['temp'], report['temp_min'], report['temp_max'] = \
+            self.__get_temperatures(forecastWeather,
+                                    ('temp', 'temp_min', 'temp_max'))
         report['condition'] = forecastWeather.get_detailed_status()
         report['icon'] = forecastWeather.get_weather_icon_name()
         self.__report_weather("hour", report)
@@ -630,52 +787,49 @@ class WeatherSkill(MycroftSkill):
             Speaks overview of week, not daily forecasts """
         report = self.__initialize_report(message)
         when, _ = self.__extract_datetime(message.data['utterance'])
-        today, _ = self.__extract_datetime("today")
+        today = self.__get_today()
         if not when:
             when = today
         days = [when + timedelta(days=i) for i in range(7)]
-        # Fetch forecasts/reports for week
-        forecasts = [dict(self.__populate_forecast(report, day,
-                                                   preface_day=False))
-                     if day != today
-                     else dict(self.__populate_current(report, day))
-                     for day in days]
+        # Fetch the daily forecasts once and pick the days of the week
+        daily = self.__get_forecasts_by_date(
+            report['full_location'], report['lat'], report['lon'])
+        forecasts = []
+        for day in days:
+            if day == today:
+                forecast = self.__populate_current(dict(report),
+                                                   forecasts=daily)
+            elif day.date() in daily:
+                forecast = self.__populate_forecast_weather(
+                    dict(report), daily[day.date()], day, preface_day=False)
+            else:
+                forecast = None
+            forecasts.append(forecast)
 
-        if forecasts is None:
+        if None in forecasts:
             self.__report_no_data('weather')
             return
 
-        # collate forecasts
-        collated = {'condition': [], 'condition_cat': [], 'icon': [],
-                    'temp': [], 'temp_min': [], 'temp_max': []}
-        for fc in forecasts:
-            for attribute in collated.keys():
-                collated[attribute].append(fc.get(attribute))
+        # group the days by condition category
+        category_count = Counter()
+        days_with_cat = defaultdict(list)
+        for i, fc in enumerate(forecasts):
+            category_count[fc['condition_cat']] += 1
+            days_with_cat[fc['condition_cat']].append(i)
 
         # analyse for commonality/difference
-        primary_category = max(collated['condition_cat'],
-                               key=collated['condition_cat'].count)
-        days_with_primary_cat, conditions_in_primary_cat = [], []
-        days_with_other_cat = {}
-        for i, item in enumerate(collated['condition_cat']):
-            if item == primary_category:
-                days_with_primary_cat.append(i)
-                conditions_in_primary_cat.append(collated['condition'][i])
-            else:
-                if not days_with_other_cat.get(item):
-                    days_with_other_cat[item] = []
-                days_with_other_cat[item].append(i)
-        primary_condition = max(conditions_in_primary_cat,
-                                key=conditions_in_primary_cat.count)
+        primary_category = category_count.most_common(1)[0][0]
+        days_with_primary_cat = days_with_cat.pop(primary_category)
+        days_with_other_cat = days_with_cat
 
         # CONSTRUCT DIALOG
         speak_category = self.translate_namedvalues('condition.category')
+        speak_days = [self.__to_day(day) for day in days]
         # 0. Report period starting day
         if days[0] == today:
             dialog = self.translate('this.week')
         else:
-            speak_day = self.__to_day(days[0])
-            dialog = self.translate('from.day', {'day': speak_day})
+            dialog = self.translate('from.day', {'day': speak_days[0]})
 
         # 1. whichever is longest (has most days), report as primary
         # if over half the days => "it will be mostly {cond}"
@@ -693,12 +847,10 @@ class WeatherSkill(MycroftSkill):
             for seq in seq_primary_days:
                 if seq is not seq_primary_days[0]:
                     dialog = self.concat_dialog(dialog, 'and')
-                day_from = self.__to_day(days[seq[0]])
-                day_to = self.__to_day(days[seq[-1]])
                 dialog = self.concat_dialog(dialog,
                                             'weekly.conditions.seq.period',
-                                            {'from': day_from,
-                                                'to': day_to})
+                                            {'from': speak_days[seq[0]],
+                                                'to': speak_days[seq[-1]]})
         else:
             # condition occurs on random days
             dialog = self.concat_dialog(dialog,
@@ -718,32 +870,33 @@ class WeatherSkill(MycroftSkill):
                     seq_dialog = spoken_cat
                 else:
                     seq_dialog = self.translate('and')
-                day_from = self.__to_day(days[seq[0]])
-                day_to = self.__to_day(days[seq[-1]])
                 seq_dialog = self.concat_dialog(
                     seq_dialog,
                     self.translate('weekly.conditions.seq.period',
-                                   {'from': day_from,
-                                    'to': day_to}))
+                                   {'from': speak_days[seq[0]],
+                                    'to': speak_days[seq[-1]]}))
                 dialog_list.append(seq_dialog)
             if not seq_days:
                 for day in cat_days:
-                    speak_day = self.__to_day(days[day])
                     dialog_list.append(self.translate(
                         'weekly.condition.on.day',
-                        {'condition': collated['condition'][day],
-                            'day': speak_day}))
+                        {'condition': forecasts[day]['condition'],
+                            'day': speak_days[day]}))
         dialog = join_list(dialog_list, 'and')
         self.speak_dialog(dialog)
 
         # 3. Report temps:
-        temp_ranges = {
-            'low_min': min(collated['temp_min']),
-            'low_max': max(collated['temp_min']),
-            'high_min': min(collated['temp_max']),
-            'high_max': max(collated['temp_max'])
-        }
-        self.speak_dialog('weekly.temp.range', temp_ranges)
+        # compare as numbers, the report holds them as strings
+        lows = [int(fc['temp_min']) for fc in forecasts if fc['temp_min']]
+        highs = [int(fc['temp_max']) for fc in forecasts if fc['temp_max']]
+        if lows and highs:
+            temp_ranges = {
+                'low_min': min(lows),
+                'low_max': max(lows),
+                'high_min': min(highs),
+                'high_max': max(highs)
+            }
+            self.speak_dialog('weekly.temp.range', temp_ranges)
 
     # CONDITION BASED QUERY HANDLERS ####
     @intent_handler(IntentBuilder("").require("Temperature")
@@ -927,12 +1080,12 @@ class WeatherSkill(MycroftSkill):
         report = self.__initialize_report(message)
 
         # Get a date from spoken request
-        today, _ = self.__extract_datetime("today")
+        today = self.__get_today()
         when, _ = self.__extract_datetime(message.data.get('utterance'),
                                           lang=self.lang)
 
         # search the forecast for precipitation
-        weathers = self.owm.daily_forecast(
+        weathers = self.__cached_daily_forecast(
             report['full_location'],
             report['lat'],
             report['lon'], 10).get_forecast()
@@ -942,15 +1095,18 @@ class WeatherSkill(MycroftSkill):
             return
 
         weathers = weathers.get_weathers()
+        if when and when != today:
+            # User asked about a specific date, only check that day
+            by_date = {
+                datetime.fromtimestamp(w.get_reference_time()).date(): w
+                for w in weathers
+            }
+            weathers = [by_date[when.date()]] if when.date() in by_date else []
+
         for weather in weathers:
 
             forecastDate = datetime.fromtimestamp(weather.get_reference_time())
 
-            if when and when != today:
-                # User asked about a specific date, is this it?
-                if forecastDate.date() != when.date():
-                    continue
-
             rain = weather.get_rain()
             if rain and rain["all"] > 0:
                 data = {
@@ -988,19 +1144,7 @@ class WeatherSkill(MycroftSkill):
                     .optionally("RelativeDay").optionally("Location").build())
     def handle_humidity(self, message):
         report = self.__initialize_report(message)
-
-        when, _ = self.__extract_datetime(message.data.get('utterance'),
-                                          lang=self.lang)
-        today, _ = self.__extract_datetime("today")
-        if when is None or when == today:
-            weather = self.owm.weather_at_place(
-                report['full_location'],
-                report['lat'],
-                report['lon']).get_weather()
-        else:
-            # Get forecast for that day
-            weather = self.__get_forecast(
-                when, report['full_location'], report['lat'], report['lon'])
+        when, today, weather = self.__get_weather_for_when(message, report)
 
         if weather is None:
             self.__report_no_data('weather')
@@ -1013,7 +1157,8 @@ class WeatherSkill(MycroftSkill):
         value = self.translate('percentage.number',
                                {'num': str(weather.get_humidity())})
         loc = message.data.get('Location')
-        self.__report_condition(self.__translate("humidity"), value, when, loc)
+        self.__report_condition(self.__translate("humidity"), value, when, loc,
+                                today)
 
     # Handle: How windy is it?
     @intent_handler(IntentBuilder("").require("Query").require("Windy")
@@ -1021,18 +1166,7 @@ class WeatherSkill(MycroftSkill):
                     .optionally("RelativeDay").build())
     def handle_windy(self, message):
         report = self.__initialize_report(message)
-
-        when, _ = self.__extract_datetime(message.data.get('utterance'))
-        today, _ = self.__extract_datetime("today")
-        if when is None or when == today:
-            weather = self.owm.weather_at_place(
-                report['full_location'],
-                report['lat'],
-                report['lon']).get_weather()
-        else:
-            # Get forecast for that day
-            weather = self.__get_forecast(
-                when, report['full_location'], report['lat'], report['lon'])
+        when, today, weather = self.__get_weather_for_when(message, report)
 
         if weather is None:
             self.__report_no_data('weather')
@@ -1054,7 +1188,8 @@ class WeatherSkill(MycroftSkill):
                                      data={"speed": nice_number(speed),
                                            "unit": unit})
         loc = message.data.get('Location')
-        self.__report_condition(self.__translate("winds"), value, when, loc)
+        self.__report_condition(self.__translate("winds"), value, when, loc,
+                                today)
         self.speak_dialog('wind.strength.' + strength)
 
     def get_wind_speed(self, weather):
@@ -1064,43 +1199,28 @@ class WeatherSkill(MycroftSkill):
         # get speed
         if self.__get_speed_unit() == "mph":
             unit = self.__translate("miles per hour")
-            speed_multiplier = 2.23694
+            speed_multiplier = MILES_PER_HOUR_MULTIPLIER
             speed *= speed_multiplier
         else:
             unit = self.__translate("meters per second")
             speed_multiplier = 1
-        speed = round(speed)
+        # round half up, wind speeds are never negative
+        speed = int(speed + 0.5)
 
-        if (speed / speed_multiplier) < 0:
+        speed_mps = speed / speed_multiplier
+        if speed_mps < 0:
             self.log.error("Wind speed below zero")
-        if (speed / speed_multiplier) <= 2.2352:
+        if speed_mps <= LIGHT_WIND_MAX_MPS:
             strength = "light"
-        elif (speed / speed_multiplier) <= 6.7056:
+        elif speed_mps <= MEDIUM_WIND_MAX_MPS:
             strength = "medium"
         else:
             strength = "hard"
 
         # get direction, convert compass degrees to named direction
         if "deg" in wind:
-            deg = wind["deg"]
-            if deg < 22.5:
-                dir = "N"
-            elif deg < 67.5:
-                dir = "NE"
-            elif deg < 112.5:
-                dir = "E"
-            elif deg < 157.5:
-                dir = "SE"
-            elif deg < 202.5:
-                dir = "S"
-            elif deg < 247.5:
-                dir = "SW"
-            elif deg < 292.5:
-                dir = "W"
-            elif deg < 337.5:
-                dir = "NW"
-            else:
-                dir = "N"
+            # Each direction covers 45 degrees centered on it
+            dir = WIND_DIRECTIONS[int((wind["deg"] + 22.5) // 45) % 8]
         else:
             dir = None
 
@@ -1111,28 +1231,19 @@ class WeatherSkill(MycroftSkill):
                     .optionally("Location").require("Sunrise").build())
     def handle_sunrise(self, message):
         report = self.__initialize_report(message)
+        # There appears to be a bug in OWM, it can't extract the sunrise/
+        # sunset from forecast objects.  As of March 2018 OWM said it was
+        # "in the roadmap". Just say "I don't know" for other days for now
+        when, today, weather = self.__get_weather_for_when(
+            message, report, allow_forecast=False)
 
-        when, _ = self.__extract_datetime(message.data.get('utterance'))
-        today, _ = self.__extract_datetime("today")
-        if when is None or when.date() == today.date():
-            weather = self.owm.weather_at_place(
-                report['full_location'],
-                report['lat'],
-                report['lon']).get_weather()
-
-            if weather is None:
-                self.__report_no_data('weather')
-                return
-        else:
-            # Get forecast for that day
-            # weather = self.__get_forecast(when, report['full_location'],
-            #                               report['lat'], report['lon'])
-
-            # There appears to be a bug in OWM, it can't extract the sunrise/
-            # sunset from forecast objects.  As of March 2018 OWM said it was
-            # "in the roadmap". Just say "I don't know" for now
-            weather = None
-        if not weather or weather.get_humidity() == 0:
+        if when is not None and when.date() != today.date():
+            self.speak_dialog("do not know")
+            return
+        if weather is None:
+            self.__report_no_data('weather')
+            return
+        if weather.get_humidity() == 0:
             self.speak_dialog("do not know")
             return
 
@@ -1148,28 +1259,19 @@ class WeatherSkill(MycroftSkill):
                     .optionally("Location").require("Sunset").build())
     def handle_sunset(self, message):
         report = self.__initialize_report(message)
+        # There appears to be a bug in OWM, it can't extract the sunrise/
+        # sunset from forecast objects.  As of March 2018 OWM said it was
+        # "in the roadmap". Just say "I don't know" for other days for now
+        when, today, weather = self.__get_weather_for_when(
+            message, report, allow_forecast=False)
 
-        when, _ = self.__extract_datetime(message.data.get('utterance'))
-        today, _ = self.__extract_datetime("today")
-        if when is None or when.date() == today.date():
-            weather = self.owm.weather_at_place(
-                report['full_location'],
-                report['lat'],
-                report['lon']).get_weather()
-
-            if weather is None:
-                self.__report_no_data('weather')
-                return
-        else:
-            # Get forecast for that day
-            # weather = self.__get_forecast(when, report['full_location'],
-            #                               report['lat'], report['lon'])
-
-            # There appears to be a bug in OWM, it can't extract the sunrise/
-            # sunset from forecast objects.  As of March 2018 OWM said it was
-            # "in the roadmap". Just say "I don't know" for now
-            weather = None
-        if not weather or weather.get_humidity() == 0:
+        if when is not None and when.date() != today.date():
+            self.speak_dialog("do not know")
+            return
+        if weather is None:
+            self.__report_no_data('weather')
+            return
+        if weather.get_humidity() == 0:
             self.speak_dialog("do not know")
             return
 
@@ -1180,6 +1282,38 @@ class WeatherSkill(MycroftSkill):
         spoken_time = self.__nice_time(dtSunset, use_ampm=True)
         self.speak_dialog('sunset', {'time': spoken_time})
 
+    def __get_weather_for_when(self, message, report, allow_forecast=True):
+        """ Get the weather for the day requested in the message.
+
+        Current conditions are used for today, the daily forecast for any
+        other day.
+
+        Arguments:
+            message (Message): messagebus message
+            report (dict): report base
+            allow_forecast (bool): if False no forecast is looked up for
+                                   other days than today
+        Returns:
+            tuple (when, today, weather) where weather is None if no data is
+            available or a forecast was needed but not allowed. Callers can
+            tell the two apart from when and today.
+        """
+        when, _ = self.__extract_datetime(message.data.get('utterance'),
+                                          lang=self.lang)
+        today = self.__get_today()
+        if when is None or when.date() == today.date():
+            weather = self.__cached_weather_at_place(
+                report['full_location'],
+                report['lat'],
+                report['lon']).get_weather()
+        elif allow_forecast:
+            # Get forecast for that day
+            weather = self.__get_forecast(
+                when, report['full_location'], report['lat'], report['lon'])
+        else:
+            weather = None
+        return when, today, weather
+
     def __get_location(self, message):
         """ Attempt to extract a location from the spoken phrase.
 
@@ -1201,8 +1335,9 @@ class WeatherSkill(MycroftSkill):
                 lon = location["coordinate"]["longitude"]
                 city = location["city"]
                 state = city["state"]
-                return lat, lon, city["name"] + ", " + state["name"] + \
-                    ", " + state["country"]["name"], self.location_pretty
+                full_location = (f'{city["name"]}, {state["name"]}, '
+                                 f'{state["country"]["name"]}')
+                return lat, lon, full_location, self.location_pretty
 
             return None
         except Exception:
@@ -1223,13 +1358,13 @@ class WeatherSkill(MycroftSkill):
 
     def __handle_typed(self, message, response_type):
         # Get a date from requests like "weather for next Tuesday"
-        today, _ = self.__extract_datetime("today")
+        today = self.__get_today()
         when, _ = self.__extract_datetime(
             message.data.get('utterance'), lang=self.lang)
 
         report = self.__initialize_report(message)
         if when and when.date() != today.date():
-            self.log.debug("Doing a forecast {} {}".format(today, when))
+            self.log.debug("Doing a forecast %s %s", today, when)
             return self.report_forecast(report, when,
                                         dialog=response_type)
         report = self.__populate_report(message)
@@ -1245,30 +1380,27 @@ class WeatherSkill(MycroftSkill):
     def __populate_report(self, message):
         unit = self.__get_requested_unit(message)
         # Get a date from requests like "weather for next Tuesday"
-        today, _ = self.__extract_datetime('today', lang='en-us')
+        today = self.__get_today(lang='en-us')
         when, _ = self.__extract_datetime(
             message.data.get('utterance'), lang=self.lang)
         when = when or today  # Get todays date if None was found
-        self.log.debug('extracted when: {}'.format(when))
+        self.log.debug('extracted when: %s', when)
 
         report = self.__initialize_report(message)
 
-        # Check if user is asking for a specific time today
-        if when.date() == today.date() and when.time() != today.time():
-            self.log.info("Forecast for time: {}".format(when))
-            return self.__populate_for_time(report, when, unit)
         # Check if user is asking for a specific day
-        elif today.date() != when.date():
+        if when.date() != today.date():
             # Doesn't seem to be hitable, safety?
-            self.log.info("Forecast for: {} {}".format(today, when))
+            self.log.info("Forecast for: %s %s", today, when)
             return self.__populate_forecast(report, when, unit,
                                             preface_day=True)
+        # Check if user is asking for a specific time today
+        if when.time() != today.time():
+            self.log.info("Forecast for time: %s", when)
+            return self.__populate_for_time(report, when, unit)
         # Otherwise user is asking for weather right now
-        else:
-            self.log.info("Forecast for now")
-            return self.__populate_current(report, unit)
-
-        return None
+        self.log.info("Forecast for now")
+        return self.__populate_current(report, unit)
 
     def __populate_for_time(self, report, when, unit=None):
         # TODO localize time to report location
@@ -1276,7 +1408,7 @@ class WeatherSkill(MycroftSkill):
         if report is None:
             return None
 
-        three_hr_fcs = self.owm.three_hours_forecast(
+        three_hr_fcs = self.__cached_three_hours_forecast(
             report['full_location'],
             report['lat'],
             report['lon'])
@@ -1300,7 +1432,7 @@ class WeatherSkill(MycroftSkill):
         report['condition'] = fc_weather.get_detailed_status()
         report['condition_cat'] = fc_weather.get_status()
         report['icon'] = fc_weather.get_weather_icon_name()
-        report['temp'] = self.__get_temperature(fc_weather, 'temp')
+        report['temp'] = self.__get_temperature(fc_weather, 'temp', unit)
         # Min and Max temps not available in 3hr forecast
         report['temp_min'] = None
         report['temp_max'] = None
@@ -1314,30 +1446,34 @@ class WeatherSkill(MycroftSkill):
 
         return report
 
-    def __populate_current(self, report, unit=None):
+    def __populate_current(self, report, unit=None, forecasts=None):
         # Return None if report is None
         if report is None:
             return None
 
+        # Unless the caller already has them, fetch the daily forecasts
+        # while getting the current conditions. Callers running on the
+        # pool must pass them in, a pool task never waits on another one.
+        if forecasts is None:
+            daily = self.__io_pool.submit(self.__get_forecasts_by_date,
+                                          report['full_location'],
+                                          report['lat'], report['lon'])
         # Get current conditions
-        currentWeather = self.owm.weather_at_place(
+        currentWeather = self.__cached_weather_at_place(
             report['full_location'], report['lat'],
             report['lon']).get_weather()
 
+        if forecasts is None:
+            forecasts = daily.result()
         if currentWeather is None:
             return None
 
         today = currentWeather.get_reference_time(timeformat='date')
-        self.log.debug("Populating report for now: {}".format(today))
+        self.log.debug("Populating report for now: %s", today)
 
         # Get forecast for the day
         # can get 'min', 'max', 'eve', 'morn', 'night', 'day'
-        # Set time to 12 instead of 00 to accomodate for timezones
-        forecastWeather = self.__get_forecast(
-            self.__to_Local(today),
-            report['full_location'],
-            report['lat'],
-            report['lon'])
+        forecastWeather = forecasts.get(self.__to_Local(today).date())
 
         if forecastWeather is None:
             return None
@@ -1352,16 +1488,14 @@ class WeatherSkill(MycroftSkill):
         report['icon'] = currentWeather.get_weather_icon_name()
         report['temp'] = self.__get_temperature(currentWeather, 'temp',
                                                 unit)
-        report['temp_min'] = self.__get_temperature(forecastWeather, 'min',
-                                                    unit)
-        report['temp_max'] = self.__get_temperature(forecastWeather, 'max',
-                                                    unit)
+        report['temp_min'], report['temp_max'] = self.__get_temperatures(
+            forecastWeather, ('min', 'max'), unit)
         report['humidity'] = self.translate(
             'percentage.number', {'num': forecastWeather.get_humidity()})
 
         wind = self.get_wind_speed(forecastWeather)
         report['wind'] = "{} {}".format(wind[0], wind[1] or "")
-        today, _ = self.__extract_datetime('today', lang='en-us')
+        today = self.__get_today(lang='en-us')
         report['day'] = self.__to_day(today, preface=True)
 
         return report
@@ -1376,7 +1510,7 @@ class WeatherSkill(MycroftSkill):
 
         Returns: None if no report available otherwise dict with weather info
         """
-        self.log.debug("Populating forecast report for: {}".format(when))
+        self.log.debug("Populating forecast report for: %s", when)
 
         # Return None if report is None
         if report is None:
@@ -1388,6 +1522,21 @@ class WeatherSkill(MycroftSkill):
         if forecast_weather is None:
             return None  # No forecast available
 
+        return self.__populate_forecast_weather(report, forecast_weather,
+                                                when, unit, preface_day)
+
+    def __populate_forecast_weather(self, report, forecast_weather, when,
+                                    unit=None, preface_day=False):
+        """ Populate the report from an already fetched forecast.
+
+        Arguments:
+            report (dict): report base
+            forecast_weather: OWM weather for the day
+            when : date for report
+            unit: Unit type to use when presenting
+
+        Returns: the populated report dict
+        """
         # This converts a status like "sky is clear" to new text and tense,
         # because you don't want: "Friday it will be 82 and the sky is clear",
         # it should be 'Friday it will be 82 and the sky will be clear'
@@ -1399,11 +1548,9 @@ class WeatherSkill(MycroftSkill):
 
         report['icon'] = forecast_weather.get_weather_icon_name()
         # Can get temps for 'min', 'max', 'eve', 'morn', 'night', 'day'
-        report['temp'] = self.__get_temperature(forecast_weather, 'day', unit)
-        report['temp_min'] = self.__get_temperature(forecast_weather, 'min',
-                                                    unit)
-        report['temp_max'] = self.__get_temperature(forecast_weather, 'max',
-                                                    unit)
+        report['temp'], report['temp_min'], report['temp_max'] = \
+            self.__get_temperatures(forecast_weather, ('day', 'min', 'max'),
+                                    unit)
         report['humidity'] = self.translate(
             'percentage.number', {'num': forecast_weather.get_humidity()})
         report['wind'] = self.get_wind_speed(forecast_weather)[0]
@@ -1449,25 +1596,24 @@ class WeatherSkill(MycroftSkill):
         if exp is None:
             exp = noun
         alternative_voc = '{}Alternatives'.format(noun.capitalize())
-        if self.voc_match(report['condition'], exp.capitalize()):
+        if self.__voc_match(report['condition'], exp.capitalize()):
             dialog = 'affirmative.condition'
         elif report.get('time'):
             # Standard response for time based dialog eg 'evening'
-            if self.voc_match(report['condition'], alternative_voc):
+            if self.__voc_match(report['condition'], alternative_voc):
                 dialog = 'cond.alternative'
             else:
                 dialog = 'no.cond.predicted'
-        elif self.voc_match(report['condition'], alternative_voc):
+        elif self.__voc_match(report['condition'], alternative_voc):
             dialog = '{}.alternative'.format(exp.lower())
         else:
             dialog = 'no.{}.predicted'.format(noun.lower())
 
-        if "Location" not in message.data:
-            dialog = 'local.' + dialog
-        if report.get('day'):
-            dialog = 'forecast.' + dialog
+        forecast = 'forecast.' if report.get('day') else ''
+        local = 'local.' if "Location" not in message.data else ''
+        dialog = f'{forecast}{local}{dialog}'
         if (report.get('time') and
-                ('at.time.' + dialog) in self.dialog_renderer.templates):
+                ('at.time.' + dialog) in self.__template_names()):
             dialog = 'at.time.' + dialog
         return dialog
 
@@ -1507,28 +1653,33 @@ class WeatherSkill(MycroftSkill):
                                 eg "on Tuesday" but NOT "on tomorrow"
         """
 
-        today, _ = self.__extract_datetime('today')
+        today = self.__get_today()
         if when is None:
             when = today
 
         if set_days:
             days = set_days
         else:
-            days = [when + timedelta(days=i) for i in range(num_days)]
-
+            one_day = timedelta(days=1)
+            days = [when]
+            for _ in range(num_days - 1):
+                days.append(days[-1] + one_day)
+
+        forecasts = self.__get_forecasts_by_date(
+            report['full_location'], report['lat'], report['lon'])
+        # Populate the days concurrently but speak them in order
+        today_date = today.date()
+        day_reports = [self.__io_pool.submit(self.__populate_for_day, report,
+                                             day, today_date, forecasts, unit,
+                                             preface_day)
+                       for day in days]
         no_report = list()
-        for day in days:
-            if day == today:
-                self.__populate_current(report, day)
-                report['day'] = self.__to_day(day, preface_day)
-                self.__report_weather('forecast', report, rtype=dialog)
-            else:
-                report = self.__populate_forecast(report, day, unit,
-                                                  preface_day)
-                if report is None:
-                    no_report.append(self.__to_day(day, False))
-                    continue
-                self.__report_weather('forecast', report, rtype=dialog)
+        for day, day_report in zip(days, day_reports):
+            day_report = day_report.result()
+            if day_report is None:
+                no_report.append(self.__to_day(day, False))
+                continue
+            self.__report_weather('forecast', day_report, rtype=dialog)
 
         if no_report:
             dates = join_list(no_report, 'and')
@@ -1536,6 +1687,31 @@ class WeatherSkill(MycroftSkill):
             data = {'day': dates}
             self.__report_no_data('weather', data)
 
+    def __populate_for_day(self, report, day, today, forecasts, unit=None,
+                           preface_day=True):
+        """ Populate a copy of the report base for a single day.
+
+        Arguments:
+            report (dict): report base
+            day (datetime): date for report
+            today (date): current date, reported with current conditions
+            forecasts (dict): OWM weather by date for the other days
+            unit: Unit type to use when presenting
+            preface_day (bool): if appropriate day preface should be added
+
+        Returns: None if no report available otherwise dict with weather info
+        """
+        if day.date() == today:
+            day_report = self.__populate_current(dict(report), unit,
+                                                 forecasts)
+            if day_report is not None:
+                day_report['day'] = self.__to_day(day, preface_day)
+            return day_report
+        if day.date() in forecasts:
+            return self.__populate_forecast_weather(
+                dict(report), forecasts[day.date()], day, unit, preface_day)
+        return None
+
     def __report_weather(self, timeframe, report, rtype='weather',
                          separate_min_max=False):
         """ Report the weather verbally and visually.
@@ -1559,7 +1735,7 @@ class WeatherSkill(MycroftSkill):
             report['location'] = self.owm.location_translations.get(
                 report['location'], report['location'])
         weather_code = str(report['icon'])
-        img_code = self.CODES[weather_code]
+        img_code = ICON_CODES[weather_code]
 
         # Display info on a screen
         # Mark-2
@@ -1572,17 +1748,14 @@ class WeatherSkill(MycroftSkill):
         self.gui["weathercode"] = img_code
         self.gui["humidity"] = report.get("humidity", "--")
         self.gui["wind"] = report.get("wind", "--")
-        self.gui.show_pages(["weather.qml", "highlow.qml",
-                             "forecast1.qml", "forecast2.qml"])
+        self.gui.show_pages(GUI_PAGES)
         # Mark-1
         self.enclosure.deactivate_mouth_events()
         self.enclosure.weather_display(img_code, report['temp'])
 
-        dialog_name = timeframe
-        if report['location'] == self.location_pretty:
-            dialog_name += ".local"
-        dialog_name += "." + rtype
-        self.log.debug("Dialog: " + dialog_name)
+        local = ".local" if report['location'] == self.location_pretty else ""
+        dialog_name = f"{timeframe}{local}.{rtype}"
+        self.log.debug("Dialog: %s", dialog_name)
         self.speak_dialog(dialog_name, report)
 
         # Just show the icons while still speaking
@@ -1597,21 +1770,18 @@ class WeatherSkill(MycroftSkill):
         self.enclosure.activate_mouth_events()
         self.enclosure.mouth_reset()
 
-    def __report_condition(self, name, value, when, location=None):
+    def __report_condition(self, name, value, when, location=None,
+                           today=None):
         # Report a specific value
-        data = {
-            "condition": name,
-            "value": value,
-        }
-        report_type = "report.condition"
-        today, _ = self.__extract_datetime("today")
-        if when and when.date() != today.date():
+        data = {"condition": name, "value": value}
+        today = today or self.__get_today()
+        future = bool(when) and when.date() != today.date()
+        if future:
             data["day"] = self.__to_day(when, preface=True)
-            report_type += ".future"
         if location:
             data["location"] = location
-            report_type += ".at.location"
-        self.speak_dialog(report_type, data)
+        self.speak_dialog(REPORT_CONDITION_DIALOGS[future, bool(location)],
+                          data)
 
     def __get_forecast(self, when, location, lat, lon):
         """ Get a forecast for the given time and location.
@@ -1622,18 +1792,138 @@ class WeatherSkill(MycroftSkill):
             lat: Latitude for report
             lon: Longitude for report
         """
+        # None if there is no forecast for the given day
+        return self.__get_forecasts_by_date(location, lat, lon).get(
+            when.date())
 
-        # search for the requested date in the returned forecast data
-        forecasts = self.owm.daily_forecast(location, lat, lon, limit=14)
-        forecasts = forecasts.get_forecast()
-        for weather in forecasts.get_weathers():
-            forecastDate = weather.get_reference_time("date")
-            if forecastDate.date() == when.date():
-                # found the right day, now format up the results
-                return weather
+    def __get_forecasts_by_date(self, location, lat, lon):
+        """ Get the daily forecasts for a location indexed by date.
 
-        # No forecast for the given day
-        return None
+        Arguments:
+            location: location
+            lat: Latitude for report
+            lon: Longitude for report
+        Returns:
+            dict: OWM weather for each forecast date
+        """
+        def index_forecasts():
+            forecasts = self.__cached_daily_forecast(location, lat, lon,
+                                                     limit=14)
+            return {weather.get_reference_time("date").date(): weather
+                    for weather in forecasts.get_forecast().get_weathers()}
+
+        return self.__cached_call(('daily by date', location, lat, lon),
+                                  self.__cache_ttl('forecast_cache_ttl',
+                                                   FORECAST_CACHE_TTL),
+                                  index_forecasts)
+
+    def __cached_call(self, key, ttl, func, *args, **kwargs):
+        """ Call func, reusing its result for up to ttl seconds.
+
+        Failed calls are not cached, nor are results built from stale
+        responses OWMApi served after a failed request. Expired results are
+        dropped whenever a new one is stored, and when more than
+        API_CACHE_SIZE results are still held the least recently fetched
+        one is dropped as well. Results are kept per OWM language since
+        condition texts are localized.
+
+            Arguments:
+                key (tuple): identifies the call and its arguments
+                ttl (int): seconds a result stays valid
+                func: function to call on a cache miss
+            Returns:
+                result of func(*args, **kwargs)
+        """
+        key = (self.owm.owmlang,) + key
+        now = time.time()
+        cached = self.__api_cache.get(key)
+        if cached and now < cached[0]:
+            return cached[1]
+
+        stale = self.owm.stale_count()
+        result = func(*args, **kwargs)
+        if self.owm.stale_count() != stale:
+            # Fallback after a failed request, don't extend its lifetime
+            return result
+        with self.__api_cache_lock:
+            cache = {k: v for k, v in self.__api_cache.items()
+                     if k != key and now < v[0]}
+            cache[key] = (now + ttl, result)
+            if len(cache) > API_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            self.__api_cache = cache
+        return result
+
+    def __load_api_cache(self):
+        """ Load the OWM results saved by the previous run of the skill.
+
+        Results that have expired since are dropped.
+        """
+        path = os.path.join(self.file_system.path, API_CACHE_FILE)
+        try:
+            with open(path, 'rb') as f:
+                cache = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self.log.warning('Could not load the weather cache '
+                             '({})'.format(repr(e)))
+            return
+        now = time.time()
+        self.__api_cache = {k: v for k, v in cache.items() if now < v[0]}
+
+    def __save_api_cache(self):
+        """ Save the unexpired OWM results for the next run of the skill. """
+        path = os.path.join(self.file_system.path, API_CACHE_FILE)
+        now = time.time()
+        cache = {k: v for k, v in self.__api_cache.items() if now < v[0]}
+        try:
+            # Write to a temporary file first to never leave a partial cache
+            with open(path + '.tmp', 'wb') as f:
+                pickle.dump(cache, f)
+            os.replace(path + '.tmp', path)
+        except Exception as e:
+            self.log.warning('Could not save the weather cache '
+                             '({})'.format(repr(e)))
+
+    def __cache_ttl(self, setting, default):
+        """ Get a cache lifetime from the skill settings.
+
+        The settings are in minutes, missing or invalid values fall back to
+        the default.
+
+            Arguments:
+                setting (str): name of the setting
+                default (int): lifetime in seconds
+            Returns:
+                (int) lifetime in seconds
+        """
+        try:
+            minutes = int(float(self.settings.get(setting) or 0))
+        except (TypeError, ValueError):
+            minutes = 0
+        return minutes * MINUTES if minutes > 0 else default
+
+    def __cached_weather_at_place(self, location, lat, lon):
+        return self.__cached_call(('weather', location, lat, lon),
+                                  self.__cache_ttl('current_cache_ttl',
+                                                   CURRENT_CACHE_TTL),
+                                  self.owm.weather_at_place,
+                                  location, lat, lon)
+
+    def __cached_three_hours_forecast(self, location, lat, lon):
+        return self.__cached_call(('3h', location, lat, lon),
+                                  self.__cache_ttl('current_cache_ttl',
+                                                   CURRENT_CACHE_TTL),
+                                  self.owm.three_hours_forecast,
+                                  location, lat, lon)
+
+    def __cached_daily_forecast(self, location, lat, lon, limit=None):
+        return self.__cached_call(('daily', location, lat, lon, limit),
+                                  self.__cache_ttl('forecast_cache_ttl',
+                                                   FORECAST_CACHE_TTL),
+                                  self.owm.daily_forecast,
+                                  location, lat, lon, limit=limit)
 
     def __get_requested_unit(self, message):
         """ Get selected unit from message.
@@ -1644,13 +1934,18 @@ class WeatherSkill(MycroftSkill):
         Returns:
             'fahrenheit', 'celsius' or None
         """
-        if message and message.data and 'Unit' in message.data:
+        if not (message and message.data and 'Unit' in message.data):
+            return None
+        # A message is usually asked for its unit more than once. Read the
+        # cache once, handlers on other threads may replace it meanwhile.
+        cached_message, unit = self.__unit_cache
+        if cached_message is not message:
             if self.voc_match(message.data['Unit'], 'Fahrenheit'):
-                return 'fahrenheit'
+                unit = 'fahrenheit'
             else:
-                return 'celsius'
-        else:
-            return None
+                unit = 'celsius'
+            self.__unit_cache = (message, unit)
+        return unit
 
     def concat_dialog(self, current, dialog, data=None):
         return current + " " + self.translate(dialog, data)
@@ -1665,21 +1960,13 @@ class WeatherSkill(MycroftSkill):
             None if no sequential numbers found
             seq_nums (list[list]): list of sequence lists
         """
-        current_seq, seq_nums = [], []
-        seq_active = False
-        for idx, day in enumerate(nums):
-            if idx+1 < len(nums) and nums[idx+1] == (day + 1):
-                current_seq.append(day)
-                seq_active = True
-            elif seq_active:
-                # last day in sequence
-                current_seq.append(day)
-                seq_nums.append(current_seq.copy())
-                current_seq = []
-                seq_active = False
-
-        # if len(seq_nums) == 0:
-        #     return None
+        seq_nums = []
+        # Within a sequence every number is its index plus the same offset
+        for _, group in groupby(enumerate(nums),
+                                lambda item: item[1] - item[0]):
+            seq = [num for _, num in group]
+            if len(seq) > 1:
+                seq_nums.append(seq)
         return seq_nums
 
     def __get_speed_unit(self):
@@ -1712,17 +1999,28 @@ class WeatherSkill(MycroftSkill):
     def __get_temperature(self, weather, key, unit=None):
         # Extract one of the temperatures from the weather data.
         # Typically it has: 'temp', 'min', 'max', 'morn', 'day', 'night'
+        return self.__get_temperatures(weather, (key,), unit)[0]
+
+    def __get_temperatures(self, weather, keys, unit=None):
+        """ Extract several temperatures from the weather data.
+
+        The weather data is converted to the unit once for all keys.
+
+        Arguments:
+            weather (Weather): weather data from OWM
+            keys (iterable): temperature keys, e.g. ('day', 'min', 'max')
+            unit (str): temperature unit, defaults to the configured unit
+        Returns:
+            (list) rounded temperatures as strings, '' where unavailable
+        """
         try:
             unit = unit or self.__get_temperature_unit()
-            # fallback to general temperature if missing
-            temp = weather.get_temperature(unit)[key]
-            if temp is not None:
-                return str(int(round(temp)))
-            else:
-                return ''
+            temps = weather.get_temperature(unit)
+            return [str(round(temps[key])) if temps.get(key) is not None
+                    else '' for key in keys]
         except Exception as e:
             self.log.warning('No temperature available ({})'.format(repr(e)))
-            return ''
+            return [''] * len(keys)
 
     def __api_error(self, e):
         if isinstance(e, LocationNotFoundError):
@@ -1744,9 +2042,17 @@ class WeatherSkill(MycroftSkill):
                 string: the speakable date text
         """
         now = datetime.now()
+        days_diff = (when.date() - now.date()).days
+        if days_diff == 0:
+            # The text for today only changes with the date and language
+            key = (self.lang, now.date())
+            if self.__today_text[0] != key:
+                self.__today_text = (key, nice_date(when, lang=self.lang,
+                                                    now=now).split(',')[0])
+            return self.__today_text[1]
+
         speakable_date = nice_date(when, lang=self.lang, now=now)
         # Test if speakable_date is a relative reference eg "tomorrow"
-        days_diff = (when.date() - now.date()).days
         if preface and (-1 > days_diff or days_diff > 1):
             speakable_date = "{} {}".format(self.translate('on.date'),
                                             speakable_date)
@@ -1763,26 +2069,12 @@ class WeatherSkill(MycroftSkill):
             # Fallback to the old pytz code
             if not when.tzinfo:
                 when = when.replace(tzinfo=pytz.utc)
-            timezone = pytz.timezone(self.location["timezone"]["code"])
-            return when.astimezone(timezone)
+            return when.astimezone(get_timezone(
+                self.location["timezone"]["code"]))
 
     def __to_time_period(self, when):
         # Translate a specific time '9am' to period of the day 'morning'
-        hour = when.time().hour
-        period = None
-        if hour >= 1 and hour < 5:
-            period = "early morning"
-        if hour >= 5 and hour < 12:
-            period = "morning"
-        if hour >= 12 and hour < 17:
-            period = "afternoon"
-        if hour >= 17 and hour < 20:
-            period = "evening"
-        if hour >= 20 or hour < 1:
-            period = "overnight"
-        if period is None:
-            self.log.error("Unable to parse time as a period of day")
-        return period
+        return HOUR_TO_PERIOD[when.hour]
 
     # Suggestion TODO: Add a parameter to extract_datetime to add a default Timezone
     def __extract_datetime(self, text, anchorDate=None, lang=None, default_time=None):
@@ -1794,14 +2086,70 @@ class WeatherSkill(MycroftSkill):
         when, text = extracted_dt
         return to_utc(when), text
 
+    def __get_today(self, lang=None):
+        """ Get the datetime extracted from "today".
+
+        extract_datetime() truncates to whole seconds, so its result for
+        "today" only changes once a second. The last result per language is
+        kept so that the repeated lookups while handling an utterance don't
+        each run the full parser.
+
+            Arguments:
+                lang (str): language to parse in, defaults to the parser's
+            Returns:
+                datetime: current date and time in UTC
+        """
+        now = now_local().replace(microsecond=0)
+        # Read the entry once, pool threads may replace it meanwhile
+        cached_now, today = self.__today_cache.get(lang, (None, None))
+        if cached_now != now:
+            today, _ = self.__extract_datetime('today', lang=lang)
+            self.__today_cache[lang] = (now, today)
+        return today
+
+    def __voc_match(self, utt, voc):
+        """ Like voc_match(), with the vocabulary compiled into one regex.
+
+        The first lookup of a vocabulary goes through voc_match(), which
+        loads the .voc file. Its phrases are then joined into a single
+        pattern that matches the same complete words.
+
+            Arguments:
+                utt (str): text to check
+                voc (str): name of the vocabulary file, without .voc
+            Returns:
+                bool: True if a phrase of the vocabulary is in utt
+        """
+        cache_key = self.lang + voc
+        pattern = self.__voc_patterns.get(cache_key)
+        if pattern is None:
+            match = self.voc_match(utt, voc)
+            phrases = getattr(self, 'voc_match_cache', {}).get(cache_key)
+            if phrases:
+                self.__voc_patterns[cache_key] = re.compile(
+                    r'.*\b(?:' + '|'.join(phrases) + r')\b')
+            return bool(match)
+        return bool(utt and pattern.match(utt))
+
+    def __template_names(self):
+        """ Get the names of the dialog templates.
+
+        The set is rebuilt whenever the dialog renderer is replaced, e.g.
+        after a change of language.
+        """
+        renderer = self.dialog_renderer
+        if self.__templates[0] is not renderer:
+            self.__templates = (renderer, frozenset(renderer.templates))
+        return self.__templates[1]
+
     def __translate(self, condition, future=False, data=None):
         # behaviour of method dialog_renderer.render(...) has changed - instead
         # of exception when given template is not found now simply the
         # templatename is returned!?!
-        if (future and
-                (condition + ".future") in self.dialog_renderer.templates):
+        templates = self.__template_names()
+        if future and (condition + ".future") in templates:
             return self.translate(condition + ".future", data)
-        if condition in self.dialog_renderer.templates:
+        if condition in templates:
             return self.translate(condition, data)
         else:
             return condition
@@ -1809,9 +2157,7 @@ class WeatherSkill(MycroftSkill):
     def __nice_time(self, dt, lang="en-us", speech=True, use_24hour=False,
                     use_ampm=False):
         # compatibility wrapper for nice_time
-        nt_supported_languages = ['en', 'es', 'it', 'fr', 'de',
-                                  'hu', 'nl', 'da']
-        if not (lang[0:2] in nt_supported_languages):
+        if lang[:2] not in NICE_TIME_LANGUAGES:
             lang = "en-us"
         return nice_time(dt, lang, speech, use_24hour, use_ampm)
 